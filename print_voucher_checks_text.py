@@ -70,8 +70,10 @@ Parameters (all optional unless noted)
 --rename               After a successful print, rename the input file to
                        {stem}_printed_YYYYMMDD_HH_MM.txt. Default: OFF.
 
---encoding NAME        Code page used for WritePrinter(). Default: cp437
+--encoding NAME        Code page of the printer. Default: cp437
                        Common options: cp437, cp850, cp1252
+                       (Rendered text is folded to ASCII, which all of these
+                       share, so pages are sent as-is without re-encoding.)
 
 --charset N            ESC/P “character table” (ESC t n):
                          0=437, 2=850, 3=860, 4=863, 5=865
@@ -179,6 +181,7 @@ Notes
 import os, re, sys, argparse
 from decimal import Decimal, InvalidOperation
 from datetime import datetime
+from functools import lru_cache
 import unicodedata
 
 # --------------------------- Layout / printer grid ----------------------------
@@ -187,12 +190,13 @@ LINES_PER_PAGE = 54    # lines per page (6 LPI across ~9")
 CPI = 10.0
 LPI = 6.0
 
-ESC  = "\x1b"
-INIT = ESC + "@"
-CPI10 = ESC + "P"      # 10 CPI
-LPI6  = ESC + "2"      # 1/6" line spacing
-FF   = "\x0c"
-CRLF = "\r\n"
+ESC  = b"\x1b"
+INIT = ESC + b"@"
+CPI10 = ESC + b"P"     # 10 CPI
+LPI6  = ESC + b"2"     # 1/6" line spacing
+FF   = b"\x0c"
+CRLF = b"\r\n"
+WRITE_CHUNK = 64 * 1024  # max bytes per WritePrinter() call
 
 # line/column helpers (1-based to 0-based)
 R = lambda n: max(0, int(n) - 1)
@@ -240,16 +244,34 @@ AMT_TIGHT_RE = re.compile(
 
 ZIP_RE = re.compile(r"\b\d{5}(?:-\d{4})?\b")
 
-def asciiize(s: str) -> str:
-    if not s: return s
-    for k, v in SMART_MAP.items():
-        s = s.replace(k, v)
-    s = unicodedata.normalize("NFKD", s)
-    return s.encode("ascii", "ignore").decode("ascii")
+# Record framing in the Manager text report
+DATE_AT_START_RE = re.compile(r"^\s*(\d{2}/\d{2}/\d{4})(.*)$")
+AMT_AT_START_RE  = re.compile(r"^\s*(-?\d{1,3}(?:,\d{3})*(?:\.\d{2}))(.*)$")
+# Either of the above: a line that ends an address block (one match per line)
+BREAK_RE = re.compile(r"^\s*(?:\d{2}/\d{2}/\d{4}|-?\d{1,3}(?:,\d{3})*\.\d{2})")
+
+# Header row, compared lowercased with all whitespace removed
+REPORT_HEADER = "datecontactdescriptioncredit"
+STRIP_WS = {ord(c): None for c in " \t\r\n\v\f"}
+
+def _build_ascii_table():
+    """SMART_MAP plus the ASCII fold of U+0080..U+017F (Latin-1 Supplement and
+    Latin Extended-A); characters with no ASCII fold map to None (dropped)."""
+    table = str.maketrans(SMART_MAP)
+    for c in range(0x80, 0x180):
+        folded = unicodedata.normalize("NFKD", chr(c)).encode("ascii", "ignore").decode("ascii")
+        table[c] = folded or None
+    return table
+
+_ASCII_TABLE = _build_ascii_table()
 
-def sanitize(s: str) -> str:
+def asciiize(s: str) -> str:
     if not s: return s
-    return s.translate(str.maketrans(SMART_MAP))
+    s = s.translate(_ASCII_TABLE)
+    if s.isascii():
+        return s
+    # Rare: characters outside the table (CJK, ligatures, ...) -> slow path
+    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
 
 def split_fields_by_pipes(s: str):
     """Split on '|' trimming pieces; preserve trailing empty if line ended with '|'."""
@@ -261,64 +283,84 @@ def split_fields_by_pipes(s: str):
     return parts
 
 # ----------------------------- Page helpers ----------------------------------
-def put(linebuf, row, col, text):
-    if row < 0 or row >= len(linebuf): return
-    text = asciiize(text or "")
-    line = linebuf[row]
-    if len(line) < col:
-        line += " " * (col - len(line))
-    new = list(line)
-    for i, ch in enumerate(text):
-        p = col + i
-        if p >= CPL: break
-        if p >= len(new):
-            new.extend(" " * (p - len(new) + 1))
-        new[p] = ch
-    linebuf[row] = "".join(new)
-
-def put_right(linebuf, row, right_col_1based, text):
+# A page is one flat bytearray of LINES_PER_PAGE rows x CPL columns, pre-filled
+# with spaces; row r occupies buf[r*CPL:(r+1)*CPL].
+class Page(bytearray):
+    last_row = -1  # lowest row holding non-blank text; maintained by put()
+
+def put(buf, row, col, text):
+    """Write ASCII text (see make_record) at row/col, clipped to the page."""
+    if row < 0 or row >= LINES_PER_PAGE or col >= CPL: return
+    text = (text or "")[:CPL - col]
+    start = row * CPL + col
+    buf[start:start + len(text)] = text.encode("ascii")
+    if row > buf.last_row and text and not text.isspace():
+        buf.last_row = row
+
+def put_right(buf, row, right_col_1based, text):
     right_col = C(right_col_1based)
     start_col = max(0, right_col - len(text) + 1)
-    put(linebuf, row, start_col, text)
+    put(buf, row, start_col, text)
 
-def blank_page(): return [""] * LINES_PER_PAGE
+def blank_page(): return Page(b" " * (LINES_PER_PAGE * CPL))
 
-def trim_trailing_blank_lines(page):
-    while page and not page[-1].strip():
-        page.pop()
-    return page
+def page_lines(buf):
+    """Rows of a page with trailing spaces removed, through the last non-blank row."""
+    return [buf[r*CPL:(r+1)*CPL].rstrip() for r in range(buf.last_row + 1)]
 
 # ----------------------------- Money to words --------------------------------
+_SMALL = ("zero","one","two","three","four","five","six","seven","eight","nine",
+          "ten","eleven","twelve","thirteen","fourteen","fifteen","sixteen",
+          "seventeen","eighteen","nineteen")
+_TENS = ("","ten","twenty","thirty","forty","fifty","sixty","seventy","eighty","ninety")
+
+def _up_to_999(x):
+    parts = []
+    if x >= 100:
+        parts += [_SMALL[x//100], "hundred"]; x %= 100
+    if x >= 20:
+        parts.append(_TENS[x//10])
+        if x % 10: parts.append(_SMALL[x%10])
+    elif x > 0:
+        parts.append(_SMALL[x])
+    elif not parts:
+        parts.append("zero")
+    return " ".join(parts)
+
+# Words for 0..999, built once at import; money_words only indexes into it.
+_W3 = tuple(_up_to_999(i) for i in range(1000))
+
 def money_words(val: Decimal) -> str:
     n = int(val)
     cents = int(round((val - n) * 100))  # robust against Decimal quirks
-    small = ["zero","one","two","three","four","five","six","seven","eight","nine",
-             "ten","eleven","twelve","thirteen","fourteen","fifteen","sixteen",
-             "seventeen","eighteen","nineteen"]
-    tens = ["","ten","twenty","thirty","forty","fifty","sixty","seventy","eighty","ninety"]
-    def up_to_999(x):
-        parts = []
-        if x >= 100:
-            parts += [small[x//100], "hundred"]; x %= 100
-        if x >= 20:
-            parts.append(tens[x//10])
-            if x % 10: parts.append(small[x%10])
-        elif x > 0:
-            parts.append(small[x])
-        elif not parts:
-            parts.append("zero")
-        return " ".join(parts)
-    def chunk(x):
-        out = []
-        if x >= 1_000_000_000: out += [up_to_999(x//1_000_000_000),"billion"]; x%=1_000_000_000
-        if x >= 1_000_000:     out += [up_to_999(x//1_000_000),"million"];   x%=1_000_000
-        if x >= 1000:          out += [up_to_999(x//1000),"thousand"];       x%=1000
-        if x > 0:              out += [up_to_999(x)]
-        return " ".join(out) if out else "zero"
-    words = chunk(n) + (" dollar" if n == 1 else " dollars")
-    return (words + f" and {cents:02d}/100").capitalize()
+    return _money_words(n, cents)
+
+# Memoized: recurring amounts (rent, utilities) repeat across a batch.
+@lru_cache(maxsize=4096)
+def _money_words(n: int, cents: int) -> str:
+    out = []
+    if n > 0:
+        billions, rest = divmod(n, 1_000_000_000)
+        millions, rest = divmod(rest, 1_000_000)
+        thousands, units = divmod(rest, 1000)
+        if billions:  out.append(f"{_W3[billions]} billion")
+        if millions:  out.append(f"{_W3[millions]} million")
+        if thousands: out.append(f"{_W3[thousands]} thousand")
+        if units:     out.append(_W3[units])
+    head = " ".join(out) or "zero"
+    words = f"{head} {'dollar' if n == 1 else 'dollars'} and {cents:02d}/100"
+    return words[:1].upper() + words[1:]
 
 # ------------------------------- Parsing -------------------------------------
+# read_text cleanup in one pass: drop BOM and C0 controls (keep TAB/LF/CR), NBSP -> space
+READ_TABLE = {0xFEFF: None, 0xA0: 0x20,
+              **{c: None for c in [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)]}}
+
+def make_record(date, payee, memo, addr, amount):
+    """Build one check record; text fields are folded to ASCII here, once."""
+    return {"date": asciiize(date), "payee": asciiize(payee), "memo": asciiize(memo),
+            "addr": [asciiize(a) for a in addr], "amount": amount}
+
 def read_text(path):
     """
     Robust text read (cp1252/utf-8/latin-1/utf-16) with NBSP/control cleanup.
@@ -334,9 +376,7 @@ def read_text(path):
     else:
         with open(path, "r", encoding="latin-1", errors="replace") as f:
             raw = f.read()
-    raw = raw.replace("\ufeff", "").replace("\u00a0", " ")
-    raw = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", raw)
-    return [ln.rstrip("\r\n") for ln in raw.splitlines()]
+    return raw.translate(READ_TABLE).splitlines()
 
 def normalize_addr(addr_lines):
     """
@@ -368,11 +408,14 @@ def normalize_addr(addr_lines):
                 parts = [line1, line2]
     return parts
 
-def parse_payload_with_pipes(first_payload: str, follow_lines: list):
+def parse_payload_with_pipes(first_payload: str, lines: list, start_idx: int):
     """
     Parse one record when the user uses pipes as field terminators.
     Layout after the date (all on the same first line):
         Contact| Memo| Amount[may be jammed to addr head]  Addr... (with pipes)
+    lines[start_idx:] are the lines following the first one. Returns
+    (parsed, consumed): consumed is how many of those lines the record used
+    up (the caller advances past them); parsed is None to request fallback.
     """
     tokens = split_fields_by_pipes(first_payload)
 
@@ -386,25 +429,26 @@ def parse_payload_with_pipes(first_payload: str, follow_lines: list):
     # Find the amount in remainder; if not there, peek into the next nonblank line.
     amount = None
     addr_head = ""
+    n = len(lines)
+    k = start_idx
     m = AMT_TIGHT_RE.search(remainder or "")
     if not m:
-        j = 0
-        while j < len(follow_lines) and not follow_lines[j].strip():
+        j = start_idx
+        while j < n and not lines[j].strip():
             j += 1
-        if j < len(follow_lines):
-            m = AMT_TIGHT_RE.search(follow_lines[j])
+        if j < n:
+            m = AMT_TIGHT_RE.search(lines[j])
             if m:
-                remainder = follow_lines[j]
-                # consume that line from the caller's list
-                del follow_lines[: j + 1]
+                remainder = lines[j]
+                k = j + 1  # consume through the amount line
 
     if not m:
-        return None  # let caller fall back
+        return None, 0  # let caller fall back
 
     try:
         amount = Decimal(m.group(1).replace(",", ""))
     except InvalidOperation:
-        return None
+        return None, 0
 
     addr_head = remainder[m.end():].strip()
 
@@ -412,16 +456,16 @@ def parse_payload_with_pipes(first_payload: str, follow_lines: list):
     addr_lines = []
     if addr_head:
         addr_lines.append(addr_head)
-    for ln in follow_lines:
-        s = ln.strip()
+    for idx in range(k, n):
+        s = lines[idx].strip()
         if not s:
             break
-        if DATE_RE.match(s) or AMT_TIGHT_RE.search(s):
+        if BREAK_RE.match(s):
             break
         addr_lines.append(s)
 
     addr = normalize_addr(addr_lines)
-    return {"payee": payee, "memo": memo, "amount": amount, "addr": addr}
+    return {"payee": payee, "memo": memo, "amount": amount, "addr": addr}, k - start_idx
 
 def parse_text_report(lines):
     """
@@ -434,22 +478,19 @@ def parse_text_report(lines):
     # find the header row
     hdr = None
     for i, ln in enumerate(lines):
-        s = re.sub(r"\s+", "", ln.lower())
-        if s.startswith("datecontactdescriptioncredit"):
+        if ln.lower().translate(STRIP_WS).startswith(REPORT_HEADER):
             hdr = i
             break
     if hdr is None:
         return []
 
     i, n = hdr + 1, len(lines)
-    date_at_start = re.compile(r"^\s*(\d{2}/\d{2}/\d{4})(.*)$")
-    amt_at_start  = re.compile(r"^\s*(-?\d{1,3}(?:,\d{3})*(?:\.\d{2}))(.*)$")
     out = []
 
     while i < n:
         # Find the next line that starts with a date
         m = None
-        while i < n and not (m := date_at_start.match(lines[i])):
+        while i < n and not (m := DATE_AT_START_RE.match(lines[i])):
             if "Printable Checks - For the period" in lines[i] or "custom-report-view" in lines[i]:
                 return out
             i += 1
@@ -462,19 +503,11 @@ def parse_text_report(lines):
 
         # ---- PIPE-AWARE FAST PATH ------------------------------------------
         if "|" in first_payload:
-            follow = lines[i:]  # mutable view for the helper to consume
-            parsed = parse_payload_with_pipes(first_payload, follow)
+            parsed, consumed = parse_payload_with_pipes(first_payload, lines, i)
             if parsed:
-                # compute how many lines were consumed by the helper
-                consumed = len(lines[i:]) - len(follow)
                 i += consumed
-                out.append({
-                    "date":  date,
-                    "payee": parsed["payee"],
-                    "memo":  parsed["memo"],
-                    "addr":  parsed["addr"],
-                    "amount": parsed["amount"],
-                })
+                out.append(make_record(date, parsed["payee"], parsed["memo"],
+                                       parsed["addr"], parsed["amount"]))
                 continue
         # ---- END PIPE-AWARE FAST PATH --------------------------------------
 
@@ -489,14 +522,14 @@ def parse_text_report(lines):
             s = lines[i].rstrip()
             if not s:
                 i += 1; continue
-            if amt_at_start.match(s): break
+            if AMT_AT_START_RE.match(s): break
             if "Printable Checks - For the period" in s or "custom-report-view" in s: break
             pre.append(s.strip()); i += 1
 
         if i >= n:
             break
 
-        mamt = amt_at_start.match(lines[i].strip())
+        mamt = AMT_AT_START_RE.match(lines[i].strip())
         if not mamt:
             break
         amt_str, amt_tail = mamt.group(1), mamt.group(2)
@@ -512,7 +545,7 @@ def parse_text_report(lines):
             s = lines[i].strip()
             if not s:
                 i += 1; break
-            if date_at_start.match(s) or amt_at_start.match(s) \
+            if BREAK_RE.match(s) \
                or "Printable Checks - For the period" in s or "custom-report-view" in s:
                 break
             addr_lines.append(s); i += 1
@@ -530,7 +563,7 @@ def parse_text_report(lines):
             payee = "";                memo = ""
 
         addr = normalize_addr(addr_lines)
-        out.append({"date": date, "payee": payee, "memo": memo, "addr": addr, "amount": amount})
+        out.append(make_record(date, payee, memo, addr, amount))
         # ---- End legacy fallback -------------------------------------------
 
     return out
@@ -564,18 +597,16 @@ def parse_blocks(lines):
         payee = body[:MAX_PAYEE_LINES]; desc = body[len(payee):]
         payee_txt = " ".join([x.strip() for x in payee if x.strip()])
         desc_txt  = " ".join([x.strip() for x in desc  if x.strip()])
-        blocks.append({"date": date, "payee": payee_txt, "memo": desc_txt,
-                       "amount": amount, "addr": address})
+        blocks.append(make_record(date, payee_txt, desc_txt, address, amount))
     return blocks
 
 # ------------------------------- Rendering -----------------------------------
 def render_check_page(rec):
+    # Text fields are already ASCII (see make_record)
     page = blank_page()
-    payee = sanitize(rec["payee"])
-    memo  = sanitize(rec["memo"])
-    addr  = [sanitize(a) for a in rec["addr"]]
+    date, payee, memo, addr = rec["date"], rec["payee"], rec["memo"], rec["addr"]
 
-    put(page, ROW_DATE,  COL_DATE,  rec["date"])
+    put(page, ROW_DATE,  COL_DATE,  date)
     put_right(page, ROW_AMT_NUM, AMT_RIGHT_COL, f"{rec['amount']:.2f}")
     put(page, ROW_PAYEE, COL_PAYEE, payee)
     put(page, ROW_WORDS, COL_WORDS, money_words(rec["amount"]))
@@ -588,56 +619,55 @@ def render_check_page(rec):
 
     # Stub 1
     put(page, ROW_STUB1,   COL_STUB_LABEL, "Payee:");  put(page, ROW_STUB1,   COL_STUB_VAL,   payee)
-    put(page, ROW_STUB1+1, COL_STUB_LABEL, "Date:");   put(page, ROW_STUB1+1, COL_STUB_VAL,   rec["date"])
+    put(page, ROW_STUB1+1, COL_STUB_LABEL, "Date:");   put(page, ROW_STUB1+1, COL_STUB_VAL,   date)
     put(page, ROW_STUB1+2, COL_STUB_LABEL, "Amount:"); put(page, ROW_STUB1+2, COL_STUB_VAL,   f"${rec['amount']:.2f}")
     put(page, ROW_STUB1+3, COL_STUB_LABEL, "Memo:");   put(page, ROW_STUB1+3, COL_STUB_VAL,   memo)
 
     # Stub 2
     put(page, ROW_STUB2,   COL_STUB_LABEL, "Payee:");  put(page, ROW_STUB2,   COL_STUB_VAL,   payee)
-    put(page, ROW_STUB2+1, COL_STUB_LABEL, "Date:");   put(page, ROW_STUB2+1, COL_STUB_VAL,   rec["date"])
+    put(page, ROW_STUB2+1, COL_STUB_LABEL, "Date:");   put(page, ROW_STUB2+1, COL_STUB_VAL,   date)
     put(page, ROW_STUB2+2, COL_STUB_LABEL, "Amount:"); put(page, ROW_STUB2+2, COL_STUB_VAL,   f"${rec['amount']:.2f}")
     put(page, ROW_STUB2+3, COL_STUB_LABEL, "Memo:");   put(page, ROW_STUB2+3, COL_STUB_VAL,   memo)
 
-    page = [ln[:CPL].ljust(CPL) for ln in page]
     return page
 
-def write_text(path, pages):
-    with open(path, "w", encoding="utf-8") as f:
-        for p, page in enumerate(pages):
-            while page and not page[-1].strip():
-                page.pop()
-            for ln in page:
-                f.write(ln + "\n")
-            if p != len(pages) - 1:
-                f.write("\f")
-
-def send_raw_to_printer(printer_name, text_data, encoding, charset_num):
+def write_text(path, page_bufs):
+    """Preview file: the same CRLF page bodies sent to the printer, FF between pages."""
+    with open(path, "wb") as f:
+        f.write(FF.join(page_bufs))
+
+def send_raw_to_printer(printer_name, pages, charset_num):
+    """
+    Send already-encoded page bodies (bytes, no trailing FF) as one RAW job.
+    The whole job is assembled once and handed to WritePrinter() in
+    WRITE_CHUNK-sized pieces (a single call for any normal check run).
+    """
     try:
         import win32print
     except Exception:
         raise SystemExit("pywin32 is required for printing (pip install pywin32)")
 
     # ESC t n (character table)
-    charset_cmd = ESC + "t" + bytes([charset_num]).decode("latin-1")
-    payload = INIT + CPI10 + LPI6 + charset_cmd + text_data
+    charset_cmd = ESC + b"t" + bytes([charset_num])
+    payload = b"".join([INIT, CPI10, LPI6, charset_cmd] + [p + FF for p in pages])
 
     hPrinter = win32print.OpenPrinter(printer_name)
     try:
         win32print.StartDocPrinter(hPrinter, 1, ("Checks", None, "RAW"))
         win32print.StartPagePrinter(hPrinter)
-        win32print.WritePrinter(hPrinter, payload.encode(encoding, errors="replace"))
+        for off in range(0, len(payload), WRITE_CHUNK):
+            win32print.WritePrinter(hPrinter, payload[off:off + WRITE_CHUNK])
         win32print.EndPagePrinter(hPrinter)
         win32print.EndDocPrinter(hPrinter)
     finally:
         win32print.ClosePrinter(hPrinter)
 
 def build_calibration_page():
-    header = "".join(str((i % 10)) for i in range(1, CPL + 1))
-    lines = [header]
-    for r in range(2, LINES_PER_PAGE + 1):
-        ln = f"{r:02d}" + header[2:]
-        lines.append(ln[:CPL])
-    return CRLF.join(lines).rstrip() + FF
+    """80x54 ruler: a column-digit header, then each row numbered in cols 1-2."""
+    header = bytes(ord("0") + i % 10 for i in range(1, CPL + 1))
+    rest = header[2:]
+    lines = [header] + [b"%02d" % r + rest for r in range(2, LINES_PER_PAGE + 1)]
+    return CRLF.join(lines).rstrip()
 
 # --------------------------------- CLI ---------------------------------------
 def derive_paths(input_path):
@@ -662,7 +692,7 @@ def main():
     ap.add_argument("--printer", default="EPSON XP-7100 (GENERIC TEXT)", help="Windows printer name (default: %(default)s)")
     ap.add_argument("--no-print", action="store_true", help="Skip printing; only write preview text.")
     ap.add_argument("--rename", action="store_true", help="Rename input to *_printed_YYYYMMDD_HH_MM.txt on successful print.")
-    ap.add_argument("--encoding", default="cp437", help="RAW printer encoding/code page (default: %(default)s)")
+    ap.add_argument("--encoding", default="cp437", help="RAW printer code page; output is ASCII (default: %(default)s)")
     ap.add_argument("--charset", type=int, default=437, help="ESC/P character table: 437, 850, 860, 863, 865 (default: %(default)s)")
     ap.add_argument("--cal", action="store_true", help="Print calibration grid (no input/output) and exit.")
     ap.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
@@ -675,8 +705,7 @@ def main():
         try:
             send_raw_to_printer(
                 args.printer,
-                build_calibration_page(),
-                args.encoding,
+                [build_calibration_page()],
                 charset_map.get(args.charset, 0)
             )
             print("Calibration page sent.")
@@ -713,13 +742,12 @@ def main():
         return
 
     # Render all pages
-    pages = [trim_trailing_blank_lines(render_check_page(rec)) for rec in records]
-    page_strs = [CRLF.join(p).rstrip() for p in pages]
-    text_blob = FF.join(page_strs) + FF  # page breaks; printer init added in send_raw_to_printer
+    # Each page is joined exactly once; preview and printer share these bytes
+    page_bufs = [CRLF.join(page_lines(render_check_page(rec))) for rec in records]
 
     # Save preview (overwrite)
     try:
-        write_text(out_print, pages)
+        write_text(out_print, page_bufs)
         print(f"Wrote preview: {out_print}")
     except Exception as e:
         print(f"Failed to write preview: {e}")
@@ -728,7 +756,7 @@ def main():
     printed_ok = False
     if not args.no_print:
         try:
-            send_raw_to_printer(args.printer, text_blob, args.encoding, charset_map.get(args.charset, 0))
+            send_raw_to_printer(args.printer, page_bufs, charset_map.get(args.charset, 0))
             printed_ok = True
             print("Printed successfully.")
         except Exception as e:
@@ -739,13 +767,21 @@ def main():
     # Rename input if requested AND printed
     if args.rename and printed_ok:
         try:
-            target = renamed
-            n = 1
-            while os.path.exists(target):
-                base, ext = os.path.splitext(renamed)
-                target = f"{base}_{n}{ext}"
-                n += 1
-            os.replace(args.input, target)
+            # Reserve a free name atomically (O_EXCL), then move the input over it
+            base, ext = os.path.splitext(renamed)
+            target, n = renamed, 1
+            while True:
+                try:
+                    os.close(os.open(target, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    break
+                except FileExistsError:
+                    target = f"{base}_{n}{ext}"
+                    n += 1
+            try:
+                os.replace(args.input, target)
+            except OSError:
+                os.remove(target)  # drop the empty placeholder
+                raise
             print(f"Renamed input to: {target}")
         except Exception as e:
             print(f"Warning: could not rename input file: {e}")